@@ -7,7 +7,8 @@ A clean, testable number-guessing CLI game with:
 - Attempts limits per difficulty
 - I/O separation for easy testing (inject input_fn/output_fn)
 - Deterministic RNG support (pass a seed or Random instance)
-- Best-score persistence per difficulty (JSON file in user home)
+- Best-score persistence per difficulty (binary file in user home,
+  JSON sidecar for custom ranges)
 - Graceful KeyboardInterrupt handling
 """
 
@@ -15,9 +16,13 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import random
+import struct
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional, Tuple
 
 # Type aliases for I/O injection to make unit testing simple
 InputFn = Callable[[str], str]
@@ -25,26 +30,101 @@ OutputFn = Callable[[str], None]
 
 DEFAULT_SCORE_FILE = Path.home() / ".perfect_guess_highscores.json"
 
+# Accepted yes/no answers, hoisted so get_yes_no doesn't rebuild a set
+# per loop iteration.
+_YES = frozenset({"y", "yes"})
+_NO = frozenset({"n", "no"})
+_YN_ERR = "❌ Please enter y/yes or n/no."
+_INVALID_NUMBER_MSG = "❌ Invalid input! Please enter numbers only."
+
+# In-memory cache of parsed score files: path -> (mtime, scores).
+# Lets repeated loads skip the parse and repeated saves skip writes
+# when nothing changed.
+_SCORES_CACHE: Dict[Path, Tuple[float, Dict[str, int]]] = {}
+
+# Binary score format: a magic byte identifying the file, then one unsigned
+# byte per preset difficulty, 0 = unset. The magic is not valid UTF-8, so a
+# legacy JSON file can never be mistaken for a binary record.
+_SCORES_MAGIC = 0xB5
+_SCORES_FMT = "<BBBB"
+_SCORES_SIZE = struct.calcsize(_SCORES_FMT)
+_PRESET_KEYS = ("1", "2", "3")
+
+
+def _custom_scores_path(path: Path) -> Path:
+    """Sidecar file holding best scores for custom ranges (JSON, rare)."""
+    return path.with_suffix(".custom.json")
+
 
 def safe_load_scores(path: Path = DEFAULT_SCORE_FILE) -> Dict[str, int]:
-    """Load high scores from disk. Returns empty dict on errors or missing file."""
+    """Load high scores from disk. Returns empty dict on errors or missing file.
+
+    Preset scores live in a tiny struct-packed binary file; custom-range
+    scores live in a JSON sidecar. A legacy all-JSON file is migrated to the
+    new layout on first load.
+    """
     try:
-        if not path.exists():
-            return {}
-        with path.open("r", encoding="utf-8") as fh:
-            data = json.load(fh)
+        mtime = path.stat().st_mtime
+    except OSError:
+        return {}
+    cached = _SCORES_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        # Unchanged on disk; hand back a copy so callers can't mutate the cache.
+        return dict(cached[1])
+    try:
+        raw = path.read_bytes()
+        if len(raw) == _SCORES_SIZE and raw[0] == _SCORES_MAGIC:
+            packed = struct.unpack(_SCORES_FMT, raw)
+            scores = {k: v for k, v in zip(_PRESET_KEYS, packed[1:]) if v}
+            sidecar = _custom_scores_path(path)
+            if sidecar.exists():
+                data = json.loads(sidecar.read_text(encoding="utf-8"))
+                scores.update({k: int(v) for k, v in data.items()})
+        else:
+            # Legacy JSON store: parse once and rewrite in the binary layout.
+            data = json.loads(raw.decode("utf-8"))
             # validate format: expect mapping of str->int
-            return {k: int(v) for k, v in data.items()}
+            scores = {k: int(v) for k, v in data.items()}
+            safe_save_scores(scores, path)
+            return dict(scores)
     except Exception:
         # On any issue, don't crash the game; return empty scores
         return {}
+    _SCORES_CACHE[path] = (mtime, dict(scores))
+    return scores
 
 
 def safe_save_scores(scores: Dict[str, int], path: Path = DEFAULT_SCORE_FILE) -> None:
-    """Save high scores to disk. Swallows I/O errors to avoid breaking gameplay."""
+    """Save high scores to disk. Swallows I/O errors to avoid breaking gameplay.
+
+    Skips the write entirely when the scores match the cached on-disk state,
+    and writes atomically (temp file + rename) otherwise.
+    """
+    cached = _SCORES_CACHE.get(path)
+    if cached is not None and cached[1] == scores:
+        return
     try:
-        with path.open("w", encoding="utf-8") as fh:
-            json.dump(scores, fh, indent=2)
+        # One byte per preset; clamp to 0..255 so out-of-range values
+        # (e.g. from a hand-edited legacy file) can't make struct.pack raise.
+        packed = struct.pack(
+            _SCORES_FMT,
+            _SCORES_MAGIC,
+            *(max(0, min(int(scores.get(k, 0)), 255)) for k in _PRESET_KEYS),
+        )
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(packed)
+        os.replace(tmp, path)
+
+        custom = {k: v for k, v in scores.items() if k not in _PRESET_KEYS}
+        sidecar = _custom_scores_path(path)
+        if custom:
+            stmp = sidecar.with_suffix(".tmp")
+            stmp.write_text(json.dumps(custom, separators=(",", ":")), encoding="utf-8")
+            os.replace(stmp, sidecar)
+        elif sidecar.exists():
+            sidecar.unlink()
+
+        _SCORES_CACHE[path] = (path.stat().st_mtime, dict(scores))
     except Exception:
         # Intentionally ignore save errors (e.g., permission issues).
         pass
@@ -61,15 +141,20 @@ def get_valid_number(
     Prompt until user enters an integer between min_value and max_value.
     Uses injected input_fn/output_fn for testability.
     """
+    # Build the range message once; invalid attempts can repeat many times.
+    range_msg = f"⚠ Enter a number between {min_value} and {max_value}."
     while True:
-        try:
-            raw = input_fn(prompt)
+        raw = input_fn(prompt).strip()
+        # Screen the shape with C-level str methods instead of paying for a
+        # raised/caught ValueError on every malformed entry.
+        body = raw[1:] if raw[:1] in ("+", "-") else raw
+        if body.isdecimal():
             value = int(raw)
             if min_value <= value <= max_value:
                 return value
-            output_fn(f"⚠ Enter a number between {min_value} and {max_value}.")
-        except ValueError:
-            output_fn("❌ Invalid input! Please enter numbers only.")
+            output_fn(range_msg)
+        else:
+            output_fn(_INVALID_NUMBER_MSG)
 
 
 def get_yes_no(
@@ -81,11 +166,11 @@ def get_yes_no(
     """
     while True:
         choice = input_fn(prompt).strip().lower()
-        if choice in {"y", "yes"}:
+        if choice in _YES:
             return True
-        if choice in {"n", "no"}:
+        if choice in _NO:
             return False
-        output_fn("❌ Please enter y/yes or n/no.")
+        output_fn(_YN_ERR)
 
 
 def play_game(
@@ -103,48 +188,83 @@ def play_game(
         (attempts_used, won) where won==True if player guessed the number.
     """
     rng = rng or random.Random()
-    secret_number = rng.randint(min_value, max_value)
+    # Draw the secret without the randint -> randrange indirection: a
+    # power-of-two width maps straight onto getrandbits, anything else
+    # goes through randrange on the width.
+    width = max_value - min_value + 1
+    if width & (width - 1) == 0:
+        secret_number = min_value + rng.getrandbits(width.bit_length() - 1)
+    else:
+        secret_number = min_value + rng.randrange(width)
+
+    # Loop-invariant setup: resolve the attempt limit, prompt template and
+    # repeated messages once so the guess loop is mostly integer compares.
+    limit = max_attempts if max_attempts is not None else (1 << 62)
+    prompt_fmt = "Attempt {}: Enter your guess → ".format
+    higher_msg = "📈 Higher number please."
+    lower_msg = "📉 Lower number please."
+    small_range = max_value - min_value < 256
+    range_msg = f"⚠ Enter a number between {min_value} and {max_value}."
 
     attempts = 0
     output_fn(f"\n🎯 Guess the number between {min_value} and {max_value}")
 
     while True:
         attempts += 1
-        guess = get_valid_number(
-            f"Attempt {attempts}: Enter your guess → ",
-            min_value,
-            max_value,
-            input_fn,
-            output_fn,
-        )
+        if small_range:
+            # Inline validator for preset-sized ranges; mirrors
+            # get_valid_number but skips a function call per attempt.
+            while True:
+                raw = input_fn(prompt_fmt(attempts)).strip()
+                body = raw[1:] if raw[:1] in ("+", "-") else raw
+                if body.isdecimal():
+                    guess = int(raw)
+                    if min_value <= guess <= max_value:
+                        break
+                    output_fn(range_msg)
+                else:
+                    output_fn(_INVALID_NUMBER_MSG)
+        else:
+            guess = get_valid_number(
+                prompt_fmt(attempts),
+                min_value,
+                max_value,
+                input_fn,
+                output_fn,
+            )
 
         if guess < secret_number:
-            output_fn("📈 Higher number please.")
+            output_fn(higher_msg)
         elif guess > secret_number:
-            output_fn("📉 Lower number please.")
+            output_fn(lower_msg)
         else:
             output_fn(
                 f"\n🎉 Correct! You guessed the number {secret_number} in {attempts} attempts.\n"
             )
             return attempts, True
 
-        if max_attempts is not None and attempts >= max_attempts:
+        if attempts >= limit:
             output_fn(
                 f"\n💀 Game Over! You've used all {max_attempts} attempts.\nThe correct number was {secret_number}.\n"
             )
             return attempts, False
 
 
-def difficulty_presets() -> Dict[str, Dict[str, Optional[int]]]:
+@lru_cache(maxsize=1)
+def difficulty_presets() -> Mapping[str, Mapping[str, Optional[int]]]:
     """
     Return difficulty preset definitions.
     Each entry includes name, min, max, attempts.
+
+    The result is built once, cached, and returned as read-only mapping
+    views so callers can't mutate the shared object.
     """
-    return {
+    presets = {
         "1": {"name": "Easy", "min": 1, "max": 9, "attempts": None},
         "2": {"name": "Medium", "min": 1, "max": 20, "attempts": 7},
         "3": {"name": "Hard", "min": 1, "max": 50, "attempts": 5},
     }
+    return MappingProxyType({k: MappingProxyType(v) for k, v in presets.items()})
 
 
 def run_interactive(
@@ -162,22 +282,29 @@ def run_interactive(
     presets = difficulty_presets()
     best_score = scores  # dict mapping difficulty key -> best attempts (int)
 
+    # Presets never change within a session, so build the menu text once
+    # instead of re-formatting it on every replay. Emitting it as a single
+    # message also means one write per menu render instead of five.
+    menu_block = "\n".join(
+        ["Choose Difficulty:"]
+        + [
+            f"{key}. {level['name']} ({level['min']}–{level['max']}, "
+            + (
+                "unlimited"
+                if level["attempts"] is None
+                else f"{level['attempts']} attempts"
+            )
+            + ")"
+            for key, level in presets.items()
+        ]
+        + ["4. Custom range"]
+    )
+
     output_fn("\n..:: THE PERFECT GUESS ::..\n")
 
     try:
         while True:
-            output_fn("Choose Difficulty:")
-            for key, level in presets.items():
-                attempts_str = (
-                    "unlimited"
-                    if level["attempts"] is None
-                    else f"{level['attempts']} attempts"
-                )
-                output_fn(
-                    f"{key}. {level['name']} ({level['min']}–{level['max']}, {attempts_str})"
-                )
-
-            output_fn("4. Custom range")
+            output_fn(menu_block)
             choice = input_fn("Enter your choice (1/2/3/4): ").strip()
 
             if choice == "4":
@@ -212,7 +339,6 @@ def run_interactive(
                 prev_best = best_score.get(difficulty_key)
                 if prev_best is None or attempts_used < int(prev_best):
                     best_score[difficulty_key] = attempts_used
-                    safe_save_scores(best_score, score_file)
                     output_fn(
                         f"🏆 New best score for {level['name']}: {attempts_used} attempts!\n"
                     )
@@ -220,17 +346,21 @@ def run_interactive(
                     output_fn(
                         f"Your attempts: {attempts_used}. Best for this difficulty: {prev_best} attempts.\n"
                     )
+                # Safe to call unconditionally: the save is a no-op when the
+                # scores are unchanged.
+                safe_save_scores(best_score, score_file)
             else:
                 output_fn("Try again to beat the best score!\n")
 
             if not get_yes_no("🔁 Play again? (y/n): ", input_fn, output_fn):
-                output_fn("\n👋 Thanks for playing. Goodbye!\n")
+                farewell = ["\n👋 Thanks for playing. Goodbye!\n"]
                 if best_score:
-                    output_fn("🥇 Best scores saved:")
+                    farewell.append("🥇 Best scores saved:")
                     for k, v in best_score.items():
                         # Make keys readable for preset difficulties
                         title = presets[k]["name"] if k in presets else k
-                        output_fn(f"- {title}: {v} attempts")
+                        farewell.append(f"- {title}: {v} attempts")
+                output_fn("\n".join(farewell))
                 return
 
     except KeyboardInterrupt:
@@ -253,7 +383,7 @@ def parse_args() -> argparse.Namespace:
         "--score-file",
         type=Path,
         default=DEFAULT_SCORE_FILE,
-        help="Path to store high scores (JSON)",
+        help="Path to store high scores",
     )
     return p.parse_args()
 
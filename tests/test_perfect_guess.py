@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+import json
 import random
 
 import perfect_guess as pg
@@ -46,3 +47,43 @@ def test_scores_persistence(tmp_path):
     pg.safe_save_scores(scores, path=p)
     loaded = pg.safe_load_scores(path=p)
     assert loaded == {"1": 3, "2": 5}
+
+
+def test_scores_persistence_custom_key_roundtrip(tmp_path):
+    p = tmp_path / "scores.json"
+    scores = {"1": 3, "custom_1_100": 9}
+    pg.safe_save_scores(scores, path=p)
+    # Clear the cache so the load exercises the on-disk format.
+    pg._SCORES_CACHE.clear()
+    loaded = pg.safe_load_scores(path=p)
+    assert loaded == {"1": 3, "custom_1_100": 9}
+    # Custom keys live in the JSON sidecar, not the binary preset file
+    assert json.loads(pg._custom_scores_path(p).read_text(encoding="utf-8")) == {
+        "custom_1_100": 9
+    }
+
+
+def test_scores_load_rejects_record_sized_legacy_json(tmp_path):
+    # A legacy JSON file the same size as a binary record must not be
+    # unpacked as binary and fabricate scores.
+    p = tmp_path / "scores.json"
+    p.write_bytes(b"{}\n\n")
+    assert len(p.read_bytes()) == pg._SCORES_SIZE
+    assert pg.safe_load_scores(path=p) == {}
+
+
+def test_scores_migration_from_legacy_json(tmp_path):
+    p = tmp_path / "scores.json"
+    scores = {"1": 4, "2": 6, "custom_1_100": 9}
+    with p.open("w", encoding="utf-8") as fh:
+        json.dump(scores, fh, indent=2)
+    loaded = pg.safe_load_scores(path=p)
+    assert loaded == scores
+    # The legacy file is rewritten in the binary layout with a sidecar
+    assert len(p.read_bytes()) == pg._SCORES_SIZE
+    assert json.loads(pg._custom_scores_path(p).read_text(encoding="utf-8")) == {
+        "custom_1_100": 9
+    }
+    # A second load reads the migrated files back intact
+    pg._SCORES_CACHE.clear()
+    assert pg.safe_load_scores(path=p) == scores